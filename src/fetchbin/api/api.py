@@ -3,26 +3,18 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
 
-from . import database, models
+from . import blobs, database, models
+from .cache import outputs_page_cache, share_cache
 from .database import get_db_session
+from .shares import get_fetch_output_by_public_id
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
 ansi_converter = Ansi2HTMLConverter(inline=False)
 
 
-def get_fetch_output_by_public_id(public_id: str, session: Session = Depends(get_db_session)) -> database.FetchOutput:
-    statement = select(database.FetchOutput).where(database.FetchOutput.public_id == public_id)
-    db_output = session.exec(statement).first()
-
-    if not db_output:
-        raise HTTPException(status_code=404, detail="Output not found")
-
-    return db_output
-
-
 def _handle_vote(
     db_share: database.FetchOutput,
     request: Request,
@@ -46,21 +38,36 @@ def _handle_vote(
         raise HTTPException(status_code=409, detail="Already voted")
 
     if vote_type == "upvote":
-        db_share.upvotes += 1
-    elif vote_type == "downvote":
-        db_share.downvotes += 1
+        counter = database.FetchOutput.upvotes
+    else:
+        counter = database.FetchOutput.downvotes
 
-    new_vote = database.Vote(share_id=db_share.id, ip_address=ip_address)
-    session.add(new_vote)
+    statement = select(database.FetchOutput.upvotes, database.FetchOutput.downvotes).where(
+        database.FetchOutput.id == db_share.id
+    )
 
     try:
+        session.exec(
+            update(database.FetchOutput)
+            .where(database.FetchOutput.id == db_share.id)
+            .values({counter: counter + 1})
+        )
+        upvotes, downvotes = session.exec(statement).one()
+        session.exec(
+            update(database.FetchOutput)
+            .where(database.FetchOutput.id == db_share.id)
+            .values(hot_score=database.hot_score(upvotes, downvotes, db_share.created_at))
+        )
+        new_vote = database.Vote(share_id=db_share.id, ip_address=ip_address)
+        session.add(new_vote)
         session.commit()
-        session.refresh(db_share)
     except Exception as e:
         session.rollback()
         raise HTTPException(status_code=500, detail="Failed to record vote")
 
-    return {"upvotes": db_share.upvotes, "downvotes": db_share.downvotes}
+    share_cache.update(db_share.public_id, upvotes=upvotes, downvotes=downvotes)
+
+    return {"upvotes": upvotes, "downvotes": downvotes}
 
 
 @router.post("/share", response_class=JSONResponse)
@@ -74,15 +81,21 @@ def share_output(request: Request, share_request: models.ShareRequest, session:
         command=share_request.command,
         is_hidden=share_request.is_hidden,
     )
-    session.add(db_output)
 
     try:
+        blobs.store_content(db_output)
+        session.add(db_output)
         session.commit()
         session.refresh(db_output)
     except Exception as e:
         session.rollback()
         raise HTTPException(status_code=500, detail="Failed to create share")
 
+    share_cache.discard(db_output.public_id)
+
+    if not db_output.is_hidden:
+        outputs_page_cache.invalidate()
+
     base_url = f"{request.url.scheme}://{request.url.netloc}"
 
     return {
@@ -115,14 +128,19 @@ def downvote_output(
 def get_output(
     db_share: database.FetchOutput = Depends(get_fetch_output_by_public_id),
 ):
+    content = blobs.read_content(db_share)
+
+    if content is None:
+        raise HTTPException(status_code=404, detail="Output content not found")
+
     return {
         "public_id": db_share.public_id,
         "command": db_share.command,
         "created_at": db_share.created_at,
         "upvotes": db_share.upvotes,
         "downvotes": db_share.downvotes,
-        "content_raw": db_share.content,
-        "content_html": ansi_converter.convert(db_share.content, full=False),
+        "content_raw": content,
+        "content_html": ansi_converter.convert(content, full=False),
     }
 
 
@@ -132,22 +150,34 @@ def get_outputs_list(session: Session = Depends(get_db_session)):
     statement = statement.order_by(database.FetchOutput.id.desc())
 
     outputs_from_db = session.exec(statement).all()
-    processed_outputs = [
-        {
-            "public_id": output.public_id,
-            "command": output.command,
-            "created_at": output.created_at,
-            "upvotes": output.upvotes,
-            "downvotes": output.downvotes,
-            "content_raw": output.content,
-            "content_html": ansi_converter.convert(output.content, full=False),
-        }
-        for output in outputs_from_db
-    ]
+    processed_outputs = []
+
+    for output in outputs_from_db:
+        content = blobs.read_content(output)
+
+        if content is None:
+            continue
+
+        processed_outputs.append(
+            {
+                "public_id": output.public_id,
+                "command": output.command,
+                "created_at": output.created_at,
+                "upvotes": output.upvotes,
+                "downvotes": output.downvotes,
+                "content_raw": content,
+                "content_html": ansi_converter.convert(content, full=False),
+            }
+        )
 
     return processed_outputs
 
 
+@router.get("/stats", response_class=JSONResponse, include_in_schema=False)
+def get_cache_stats():
+    return {"share_cache": share_cache.stats()}
+
+
 @router.get("/", response_class=HTMLResponse, include_in_schema=False)
 def api_docs():
     html_content = """
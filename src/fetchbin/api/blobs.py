@@ -0,0 +1,148 @@
+import argparse
+import hashlib
+import mmap
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from sqlmodel import Session, select
+
+from . import database, models
+
+GC_GRACE_SECONDS = 60 * 60
+
+
+def is_enabled() -> bool:
+    return models.Settings.BLOB_THRESHOLD > 0
+
+
+def blob_path_for(public_id: str) -> str:
+    """Relative path of a share's blob, sharded so no directory grows too large."""
+    digest = hashlib.sha1(public_id.encode()).hexdigest()
+    return os.path.join(digest[:2], digest[2:4], public_id)
+
+
+def absolute_path(blob_path: str) -> str:
+    return os.path.join(models.Settings.BLOB_DIR, blob_path)
+
+
+def write_blob(blob_path: str, data: bytes):
+    path = absolute_path(blob_path)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def store_content(db_output: database.FetchOutput):
+    """Move ``db_output.content`` into a blob file if it is above the threshold."""
+    if not is_enabled():
+        return
+
+    data = db_output.content.encode()
+
+    if len(data) <= models.Settings.BLOB_THRESHOLD:
+        return
+
+    blob_path = blob_path_for(db_output.public_id)
+    write_blob(blob_path, data)
+    db_output.blob_path = blob_path
+    db_output.content = ""
+
+
+def read_content(db_output: database.FetchOutput) -> Optional[str]:
+    """Return the share's content, or ``None`` if its blob file is missing."""
+    if not db_output.blob_path:
+        return db_output.content
+
+    try:
+        f = open(absolute_path(db_output.blob_path), "rb")
+    except FileNotFoundError:
+        print(f"[BLOBS] Missing blob {db_output.blob_path} for share {db_output.public_id}")
+        return None
+
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return str(data, "utf-8")
+
+
+def delete_blob(db_output: database.FetchOutput):
+    if not db_output.blob_path:
+        return
+
+    try:
+        os.unlink(absolute_path(db_output.blob_path))
+    except FileNotFoundError:
+        pass
+
+
+def check_blobs(session: Session, collect: bool = False) -> Dict[str, List[str]]:
+    """Compare blob files against the database.
+
+    Returns shares whose blob is missing and blob files no share points to.
+    With ``collect``, orphaned files older than the grace period are removed;
+    younger ones may belong to a share that is still being committed.
+    """
+    statement = select(database.FetchOutput.public_id, database.FetchOutput.blob_path).where(
+        database.FetchOutput.blob_path != None
+    )
+    referenced = {}
+
+    for public_id, blob_path in session.exec(statement):
+        referenced[os.path.normpath(blob_path)] = public_id
+
+    missing = [public_id for blob_path, public_id in referenced.items() if not os.path.isfile(absolute_path(blob_path))]
+    orphaned = []
+    removed = []
+    cutoff = time.time() - GC_GRACE_SECONDS
+
+    for root, _, files in os.walk(models.Settings.BLOB_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            blob_path = os.path.relpath(path, models.Settings.BLOB_DIR)
+
+            if blob_path in referenced:
+                continue
+
+            orphaned.append(blob_path)
+
+            if collect and os.path.getmtime(path) < cutoff:
+                os.unlink(path)
+                removed.append(blob_path)
+
+    return {"missing": missing, "orphaned": orphaned, "removed": removed}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m fetchbin.api.blobs", description="Check the blob store.")
+    parser.add_argument("--gc", action="store_true", help="remove orphaned blob files")
+    args = parser.parse_args(argv)
+
+    with Session(database.engine) as session:
+        report = check_blobs(session, collect=args.gc)
+
+    for public_id in report["missing"]:
+        print(f"[BLOBS] Missing blob for share {public_id}")
+    for blob_path in report["orphaned"]:
+        print(f"[BLOBS] Orphaned blob {blob_path}")
+    for blob_path in report["removed"]:
+        print(f"[BLOBS] Removed {blob_path}")
+
+    return 1 if report["missing"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
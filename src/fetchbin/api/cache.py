@@ -0,0 +1,249 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+PAGE_CACHE_TTL = float(os.environ.get("FETCHBIN_PAGE_CACHE_TTL", 30))
+SHARE_CACHE_SIZE = int(os.environ.get("FETCHBIN_SHARE_CACHE_SIZE", 256))
+SHARE_CACHE_BYTES = int(os.environ.get("FETCHBIN_SHARE_CACHE_BYTES", 32 * 1024 * 1024))
+SHARE_CACHE_TTL = float(os.environ.get("FETCHBIN_SHARE_CACHE_TTL", 60))
+SHARE_CACHE_NEGATIVE_SIZE = int(os.environ.get("FETCHBIN_SHARE_CACHE_NEGATIVE_SIZE", 1024))
+SHARE_CACHE_NEGATIVE_TTL = float(os.environ.get("FETCHBIN_SHARE_CACHE_NEGATIVE_TTL", 10))
+
+MISSING = object()
+
+
+class _PageEntry:
+    __slots__ = ("body", "generation", "version", "expires_at", "lock", "refreshing")
+
+    def __init__(self):
+        self.body: Optional[str] = None
+        self.generation = -1
+        self.version = 0
+        self.expires_at = 0.0
+        self.lock = threading.Lock()
+        self.refreshing = False
+
+
+class PageCache:
+    """Rendered page cache with stale-while-revalidate and single-flight rebuilds.
+
+    A stale entry keeps being served while exactly one caller rebuilds it;
+    callers only block when there is no body to serve yet.
+    """
+
+    def __init__(self, ttl: float = PAGE_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, _PageEntry] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _entry(self, key: Hashable) -> _PageEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                entry = self._entries[key] = _PageEntry()
+
+            return entry
+
+    def _is_fresh(self, entry: _PageEntry) -> bool:
+        return entry.generation == self._generation and entry.expires_at > time.monotonic()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        if self.ttl <= 0:
+            return render()
+
+        entry = self._entry(key)
+        body = entry.body
+
+        if body is not None and self._is_fresh(entry):
+            return body
+
+        if body is not None:
+            with entry.lock:
+                if entry.refreshing:
+                    return body
+                entry.refreshing = True
+
+            try:
+                return self._rebuild(entry, render)
+            except Exception as e:
+                print(f"[CACHE] Failed to rebuild {key!r}, serving stale page: {e}")
+                return body
+            finally:
+                entry.refreshing = False
+
+        with entry.lock:
+            if entry.body is not None:
+                return entry.body
+
+            return self._rebuild(entry, render)
+
+    def _rebuild(self, entry: _PageEntry, render: Callable[[], str]) -> str:
+        generation = self._generation
+        version = entry.version
+        expires_at = time.monotonic() + self.ttl
+        body = render()
+        entry.body = body
+        entry.generation = generation
+
+        # An invalidation of this key during the render leaves the entry stale.
+        with self._lock:
+            entry.expires_at = expires_at if entry.version == version else 0.0
+
+        return body
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Mark one entry, or every entry, stale; the old body is served until a rebuild finishes."""
+        with self._lock:
+            if key is None:
+                self._generation += 1
+            elif key in self._entries:
+                entry = self._entries[key]
+                entry.version += 1
+                entry.expires_at = 0.0
+
+
+class LRUCache:
+    """Bounded LRU cache with per-entry TTL and hit/miss counters.
+
+    Values are limited both by count and by the total of ``weigh(value)``;
+    a value heavier than the whole budget is not cached.
+
+    ``None`` is a valid value and is used to remember lookups that found nothing.
+    Those negative entries live in their own LRU with its own size cap, so a scan
+    for unknown keys cannot evict cached values. While a negative entry is live,
+    setting a real value for that key is ignored, so a lookup that raced with a
+    delete cannot bring the deleted value back.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        negative_maxsize: int,
+        negative_ttl: float,
+        maxbytes: int = 0,
+        weigh: Callable[[Any], int] = lambda value: 0,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_maxsize = negative_maxsize
+        self.negative_ttl = negative_ttl
+        self.maxbytes = maxbytes
+        self.weigh = weigh
+        self.bytes = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._negative: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+
+    def _pop(self, key: Hashable):
+        item = self._entries.pop(key, None)
+
+        if item is not None:
+            self.bytes -= item[2]
+
+    def get(self, key: Hashable) -> Any:
+        now = time.monotonic()
+
+        with self._lock:
+            item = self._entries.get(key)
+
+            if item is not None:
+                if item[1] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return item[0]
+
+                self._pop(key)
+
+            expires_at = self._negative.get(key)
+
+            if expires_at is not None:
+                if expires_at > now:
+                    self._negative.move_to_end(key)
+                    self.negative_hits += 1
+                    return None
+
+                del self._negative[key]
+
+            self.misses += 1
+            return MISSING
+
+    def set(self, key: Hashable, value: Any):
+        now = time.monotonic()
+
+        with self._lock:
+            if value is None:
+                self._pop(key)
+
+                if self.negative_maxsize <= 0:
+                    return
+
+                self._negative[key] = now + self.negative_ttl
+                self._negative.move_to_end(key)
+
+                while len(self._negative) > self.negative_maxsize:
+                    self._negative.popitem(last=False)
+
+                return
+
+            if self._negative.get(key, 0.0) > now:
+                return
+
+            weight = self.weigh(value)
+
+            if self.maxsize <= 0 or (self.maxbytes and weight > self.maxbytes):
+                return
+
+            self._pop(key)
+            self._entries[key] = (value, now + self.ttl, weight)
+            self.bytes += weight
+
+            while len(self._entries) > self.maxsize or (self.maxbytes and self.bytes > self.maxbytes):
+                _, item = self._entries.popitem(last=False)
+                self.bytes -= item[2]
+
+    def update(self, key: Hashable, **fields):
+        """Update attributes of a cached value in place, if it is cached."""
+        with self._lock:
+            item = self._entries.get(key)
+
+            if item is not None:
+                for name, value in fields.items():
+                    setattr(item[0], name, value)
+
+    def discard(self, key: Hashable):
+        with self._lock:
+            self._pop(key)
+            self._negative.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "bytes": self.bytes,
+                "maxbytes": self.maxbytes,
+                "negative_size": len(self._negative),
+                "negative_maxsize": self.negative_maxsize,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+            }
+
+
+outputs_page_cache = PageCache()
+share_cache = LRUCache(
+    SHARE_CACHE_SIZE,
+    SHARE_CACHE_TTL,
+    SHARE_CACHE_NEGATIVE_SIZE,
+    SHARE_CACHE_NEGATIVE_TTL,
+    maxbytes=SHARE_CACHE_BYTES,
+    weigh=lambda share: len(share.content),
+)
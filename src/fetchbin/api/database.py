@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 import shortuuid
+from sqlalchemy import inspect
 from sqlmodel import Field, Session, SQLModel, create_engine
 
 from . import models
@@ -13,6 +14,49 @@ engine = create_engine(sqlite_url, connect_args=connect_args)
 
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
+    add_missing_columns()
+
+
+def add_missing_columns():
+    """Add columns introduced after a table was first created; create_all skips existing tables."""
+    inspector = inspect(engine)
+
+    with engine.begin() as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+
+                column_type = column.type.compile(engine.dialect)
+                connection.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}")
+
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+
+def hot_score(upvotes: int, downvotes: int, created_at: datetime, now: Optional[datetime] = None) -> float:
+    """Time-decayed score, HN style; the share itself counts as one point.
+
+    Never negative, so a downvoted share does not sink below shares that aged out.
+    """
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+
+    age_hours = max(((now or datetime.now(timezone.utc)) - created_at).total_seconds() / 3600, 0.0)
+
+    if age_hours >= models.Settings.HOT_WINDOW_HOURS:
+        return 0.0
+
+    return max(upvotes - downvotes + 1, 0) / (age_hours + 2) ** 1.8
+
+
+_EPOCH = datetime.fromtimestamp(0, timezone.utc)
+NEW_SHARE_HOT_SCORE = hot_score(0, 0, _EPOCH, _EPOCH)
 
 
 def get_db_session():
@@ -26,6 +70,7 @@ class FetchOutput(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     content: str = Field()
+    blob_path: Optional[str] = Field(default=None)
     public_id: str = Field(default_factory=shortuuid.uuid, unique=True, index=True)
     command: Optional[str] = Field(default=None)
     is_hidden: bool = Field(default=False)
@@ -33,6 +78,7 @@ class FetchOutput(SQLModel, table=True):
     delete_token: str = Field(default_factory=shortuuid.uuid, unique=True, index=True)
     upvotes: int = Field(default=0)
     downvotes: int = Field(default=0)
+    hot_score: Optional[float] = Field(default=NEW_SHARE_HOT_SCORE, index=True)
 
 
 class Vote(SQLModel, table=True):
@@ -10,9 +10,10 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
 
-from . import api, database, models, pages, tcp_server
+from . import api, database, models, pages, ranking, tcp_server
 
 tcp_server_task = None
+ranking_task = None
 
 
 async def startup():
@@ -24,9 +25,18 @@ async def startup():
     global tcp_server_task
     tcp_server_task = loop.create_task(tcp_server.serve_tcp())
     print("[SYSTEM] TCP server started.")
+    global ranking_task
+    ranking_task = loop.create_task(ranking.refresh_hot_scores_periodically())
 
 
 async def shutdown():
+    if ranking_task:
+        ranking_task.cancel()
+        try:
+            await ranking_task
+        except asyncio.CancelledError:
+            pass
+
     print("[SYSTEM] Stopping TCP server...")
 
     if tcp_server_task:
@@ -10,6 +10,10 @@ from sqlmodel import SQLModel
 class Settings(BaseSettings):
     DATA_DIR: ClassVar[str] = os.environ.get("FETCHBIN_DATA_DIR", "data/")
     DB_FILE: ClassVar[str] = os.path.join(DATA_DIR, "app.db")
+    BLOB_DIR: ClassVar[str] = os.path.join(DATA_DIR, "blobs")
+    BLOB_THRESHOLD: ClassVar[int] = int(os.environ.get("FETCHBIN_BLOB_THRESHOLD", 0))
+    HOT_WINDOW_HOURS: ClassVar[float] = float(os.environ.get("FETCHBIN_HOT_WINDOW_HOURS", 7 * 24))
+    HOT_REFRESH_INTERVAL: ClassVar[float] = float(os.environ.get("FETCHBIN_HOT_REFRESH_INTERVAL", 300))
 
 
 class ShareRequest(SQLModel):
@@ -1,16 +1,19 @@
+import os
 import re
 from datetime import datetime, timedelta, timezone
 
 from ansi2html import Ansi2HTMLConverter
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlmodel import Session, func, select
 
 from .. import __about__
-from . import database, models
+from . import blobs, database, models
+from .cache import outputs_page_cache, share_cache
 from .database import get_db_session
+from .shares import get_fetch_output_by_delete_token, get_fetch_output_by_public_id
 
 router = APIRouter()
 router.mount("/static", StaticFiles(directory="src/fetchbin/api/static"), name="static")
@@ -21,28 +24,6 @@ ansi_converter = Ansi2HTMLConverter(inline=False)
 ansi_escape_pattern = re.compile(r"\x1b\[[0-9;]*[A-HJKST]")
 
 
-def get_fetch_output_by_public_id(public_id: str, session: Session = Depends(get_db_session)) -> database.FetchOutput:
-    statement = select(database.FetchOutput).where(database.FetchOutput.public_id == public_id)
-    db_output = session.exec(statement).first()
-
-    if not db_output:
-        raise HTTPException(status_code=404, detail="Output not found")
-
-    return db_output
-
-
-def get_fetch_output_by_delete_token(
-    delete_token: str, session: Session = Depends(get_db_session)
-) -> database.FetchOutput:
-    statement = select(database.FetchOutput).where(database.FetchOutput.delete_token == delete_token)
-    db_output = session.exec(statement).first()
-
-    if not db_output:
-        raise HTTPException(status_code=404, detail="Share not found")
-
-    return db_output
-
-
 @router.get("/", response_class=HTMLResponse)
 def index(request: Request, session: Session = Depends(get_db_session)):
     one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
@@ -58,50 +39,81 @@ def index(request: Request, session: Session = Depends(get_db_session)):
     )
 
 
-@router.get("/outputs", response_class=HTMLResponse)
-def view_outputs_list(request: Request, sort_by: str = "newest", session: Session = Depends(get_db_session)):
-    statement = select(database.FetchOutput).where(database.FetchOutput.is_hidden == False)
-
-    if sort_by == "upvotes":
-        statement = statement.order_by(database.FetchOutput.upvotes.desc())
-    elif sort_by == "downvotes":
-        statement = statement.order_by(database.FetchOutput.downvotes.desc())
-    elif sort_by == "score":
-        statement = statement.order_by((database.FetchOutput.upvotes - database.FetchOutput.downvotes).desc())
-    else:
-        statement = statement.order_by(database.FetchOutput.id.desc())
-
-    outputs_from_db = session.exec(statement.limit(100)).all()
+OUTPUTS_PAGE_SIZE = 100
+OUTPUTS_SORTS = ("newest", "hot", "upvotes", "downvotes", "score")
+
+
+def render_outputs_list(sort_by: str) -> str:
+    with Session(database.engine) as session:
+        statement = select(database.FetchOutput).where(database.FetchOutput.is_hidden == False)
+
+        if sort_by == "hot":
+            statement = statement.order_by(database.FetchOutput.hot_score.desc(), database.FetchOutput.id.desc())
+        elif sort_by == "upvotes":
+            statement = statement.order_by(database.FetchOutput.upvotes.desc())
+        elif sort_by == "downvotes":
+            statement = statement.order_by(database.FetchOutput.downvotes.desc())
+        elif sort_by == "score":
+            statement = statement.order_by((database.FetchOutput.upvotes - database.FetchOutput.downvotes).desc())
+        else:
+            statement = statement.order_by(database.FetchOutput.id.desc())
+
+        outputs_from_db = session.exec(statement.limit(OUTPUTS_PAGE_SIZE)).all()
+
     processed_outputs = []
 
     for output in outputs_from_db:
+        content = blobs.read_content(output)
+
+        if content is None:
+            continue
+
         processed_outputs.append(
             {
                 "public_id": output.public_id,
                 "command": output.command,
-                "html_content": ansi_converter.convert(output.content, full=False),
+                "html_content": ansi_converter.convert(content, full=False),
                 "created_at": output.created_at.replace(tzinfo=timezone.utc).isoformat(),
                 "upvotes": output.upvotes,
                 "downvotes": output.downvotes,
             }
         )
 
-    return templates.TemplateResponse(
-        "outputs.html",
-        {"request": request, "outputs": processed_outputs, "sort_by": sort_by},
+    return templates.get_template("outputs.html").render(
+        {"outputs": processed_outputs, "sort_by": sort_by},
     )
 
 
+@router.get("/outputs", response_class=HTMLResponse)
+def view_outputs_list(sort_by: str = "newest"):
+    if sort_by not in OUTPUTS_SORTS:
+        sort_by = "newest"
+
+    html_content = outputs_page_cache.get_or_render(sort_by, lambda: render_outputs_list(sort_by))
+
+    return HTMLResponse(content=html_content)
+
+
 @router.get("/raw/{public_id}", response_class=PlainTextResponse)
 def view_raw_output(
     db_output: database.FetchOutput = Depends(get_fetch_output_by_public_id),
 ):
+    if db_output.blob_path:
+        if not os.path.isfile(blobs.absolute_path(db_output.blob_path)):
+            raise HTTPException(status_code=404, detail="Output content not found")
+
+        return FileResponse(blobs.absolute_path(db_output.blob_path), media_type="text/plain; charset=utf-8")
+
     return PlainTextResponse(content=db_output.content)
 
 
 @router.get("/output/{public_id}", response_class=HTMLResponse)
 def view_output(request: Request, db_output: database.FetchOutput = Depends(get_fetch_output_by_public_id)):
-    raw_ansi_text = db_output.content
+    raw_ansi_text = blobs.read_content(db_output)
+
+    if raw_ansi_text is None:
+        raise HTTPException(status_code=404, detail="Output content not found")
+
     processed_ansi_text = ansi_escape_pattern.sub("", raw_ansi_text)
     html_content = ansi_converter.convert(processed_ansi_text, full=False)
 
@@ -134,8 +146,13 @@ def delete_output(
     db_output: database.FetchOutput = Depends(get_fetch_output_by_delete_token),
     session: Session = Depends(get_db_session),
 ):
+    share_cache.discard(db_output.public_id)
     session.delete(db_output)
     session.commit()
+    blobs.delete_blob(db_output)
+    # A negative entry also blocks a lookup that read the row before the delete.
+    share_cache.set(db_output.public_id, None)
+    outputs_page_cache.invalidate()
 
     return templates.TemplateResponse("deleted.html", {"request": request})
 
@@ -0,0 +1,74 @@
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam
+from sqlmodel import Session, or_, select, update
+
+from . import database, models
+from .cache import outputs_page_cache
+
+
+def refresh_hot_scores() -> int:
+    """Recompute ``hot_score`` for shares that still have a non-zero score.
+
+    New shares start above zero and shares that age out of the window drop to
+    zero, so the filter only matches recently active shares and can be answered
+    from the ``hot_score`` index. A row only gets its new score if its vote
+    counts are unchanged, so a concurrent vote keeps the score it wrote.
+    """
+    now = datetime.now(timezone.utc)
+    statement = select(
+        database.FetchOutput.id,
+        database.FetchOutput.upvotes,
+        database.FetchOutput.downvotes,
+        database.FetchOutput.created_at,
+    ).where(
+        or_(
+            database.FetchOutput.hot_score > 0,
+            database.FetchOutput.hot_score < 0,
+            database.FetchOutput.hot_score == None,
+        )
+    )
+
+    table = database.FetchOutput.__table__
+    update_statement = (
+        update(table)
+        .where(
+            table.c.id == bindparam("share_id"),
+            table.c.upvotes == bindparam("seen_upvotes"),
+            table.c.downvotes == bindparam("seen_downvotes"),
+        )
+        .values(hot_score=bindparam("new_hot_score"))
+    )
+
+    with Session(database.engine) as session:
+        rows = session.exec(statement).all()
+        params = [
+            {
+                "share_id": share_id,
+                "seen_upvotes": upvotes,
+                "seen_downvotes": downvotes,
+                "new_hot_score": database.hot_score(upvotes, downvotes, created_at, now),
+            }
+            for share_id, upvotes, downvotes, created_at in rows
+        ]
+
+        if params:
+            session.connection().execute(update_statement, params)
+            session.commit()
+
+    outputs_page_cache.invalidate("hot")
+
+    return len(rows)
+
+
+async def refresh_hot_scores_periodically():
+    while True:
+        try:
+            loop = asyncio.get_running_loop()
+            count = await loop.run_in_executor(None, refresh_hot_scores)
+            print(f"[RANKING] Refreshed hot scores for {count} shares.")
+        except Exception as e:
+            print(f"[RANKING] Failed to refresh hot scores: {e}")
+
+        await asyncio.sleep(models.Settings.HOT_REFRESH_INTERVAL)
@@ -0,0 +1,37 @@
+from fastapi import Depends, HTTPException
+from sqlmodel import Session, select
+
+from . import database
+from .cache import MISSING, share_cache
+from .database import get_db_session
+
+
+def get_fetch_output_by_public_id(public_id: str, session: Session = Depends(get_db_session)) -> database.FetchOutput:
+    """Return a detached, possibly cached share; use its ``id`` for writes."""
+    db_output = share_cache.get(public_id)
+
+    if db_output is MISSING:
+        statement = select(database.FetchOutput).where(database.FetchOutput.public_id == public_id)
+        db_output = session.exec(statement).first()
+
+        if db_output is not None:
+            session.expunge(db_output)
+
+        share_cache.set(public_id, db_output)
+
+    if db_output is None:
+        raise HTTPException(status_code=404, detail="Output not found")
+
+    return db_output
+
+
+def get_fetch_output_by_delete_token(
+    delete_token: str, session: Session = Depends(get_db_session)
+) -> database.FetchOutput:
+    statement = select(database.FetchOutput).where(database.FetchOutput.delete_token == delete_token)
+    db_output = session.exec(statement).first()
+
+    if not db_output:
+        raise HTTPException(status_code=404, detail="Share not found")
+
+    return db_output
@@ -3,6 +3,8 @@ import os
 
 from sqlmodel import Session
 
+from . import blobs
+from .cache import outputs_page_cache, share_cache
 from .database import FetchOutput, engine
 
 TCP_HOST = os.environ.get("FETCHBIN_TCP_HOST", "0.0.0.0")
@@ -42,14 +44,20 @@ async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.Stream
 
             return
 
+        fetch_output = FetchOutput(content=content)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, blobs.store_content, fetch_output)
+
         with Session(engine) as session:
-            fetch_output = FetchOutput(content=content)
             session.add(fetch_output)
             session.commit()
             session.refresh(fetch_output)
             public_id = fetch_output.public_id
             delete_token = fetch_output.delete_token
 
+        share_cache.discard(public_id)
+        outputs_page_cache.invalidate()
+
         view_url = f"{BASE_URL}/view/{public_id}"
         delete_url = f"{BASE_URL}/delete/{delete_token}"
         response_text = f"Success! Your output has been shared.\nURL: {view_url}\nDelete URL: {delete_url}\n"
@@ -0,0 +1,6 @@
+import os
+import tempfile
+
+# The database engine and data paths are configured at import time.
+os.environ.setdefault("FETCHBIN_DATA_DIR", tempfile.mkdtemp(prefix="fetchbin-tests-"))
+os.environ.setdefault("FETCHBIN_TCP_PORT", "0")
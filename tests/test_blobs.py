@@ -0,0 +1,118 @@
+import os
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from fetchbin.api import api, blobs, database, models
+
+
+@pytest.fixture
+def blob_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(models.Settings, "BLOB_DIR", str(tmp_path / "blobs"))
+    monkeypatch.setattr(models.Settings, "BLOB_THRESHOLD", 16)
+    return tmp_path / "blobs"
+
+
+@pytest.fixture
+def client(blob_dir):
+    from fetchbin.api.main import app
+
+    app.state.limiter.reset()
+    api.limiter.reset()
+
+    with TestClient(app) as client:
+        yield client
+
+
+def test_store_content_moves_large_content_to_sharded_blob(blob_dir):
+    share = database.FetchOutput(content="x" * 32)
+    blobs.store_content(share)
+
+    assert share.content == ""
+    assert share.blob_path == blobs.blob_path_for(share.public_id)
+    assert len(share.blob_path.split(os.sep)) == 3
+    assert (blob_dir / share.blob_path).read_text() == "x" * 32
+    assert blobs.read_content(share) == "x" * 32
+
+
+def test_store_content_keeps_small_content_inline(blob_dir):
+    share = database.FetchOutput(content="small")
+    blobs.store_content(share)
+
+    assert share.content == "small"
+    assert share.blob_path is None
+    assert not blob_dir.exists()
+
+
+def test_write_blob_leaves_no_temp_files(blob_dir):
+    blobs.write_blob(blobs.blob_path_for("abc"), b"data")
+
+    files = [name for _, _, names in os.walk(blob_dir) for name in names]
+    assert files == ["abc"]
+
+
+def test_read_content_returns_none_for_missing_blob(blob_dir):
+    share = database.FetchOutput(content="x" * 32)
+    blobs.store_content(share)
+    shutil.rmtree(blob_dir)
+
+    assert blobs.read_content(share) is None
+
+
+def test_check_blobs_reports_missing_and_collects_old_orphans(blob_dir):
+    database.create_db_and_tables()
+    share = database.FetchOutput(content="m" * 32)
+    blobs.store_content(share)
+    os.unlink(blobs.absolute_path(share.blob_path))
+
+    orphan = blob_dir / "ab" / "cd" / "orphan"
+    orphan.parent.mkdir(parents=True)
+    orphan.write_text("orphan")
+    os.utime(orphan, (0, 0))
+    fresh_orphan = blob_dir / "ab" / "cd" / "fresh"
+    fresh_orphan.write_text("fresh")
+
+    with Session(database.engine) as session:
+        session.add(share)
+        session.commit()
+        report = blobs.check_blobs(session, collect=True)
+        session.delete(share)
+        session.commit()
+
+    assert report["missing"] == [share.public_id]
+    assert sorted(report["orphaned"]) == [os.path.join("ab", "cd", "fresh"), os.path.join("ab", "cd", "orphan")]
+    assert report["removed"] == [os.path.join("ab", "cd", "orphan")]
+    assert not orphan.exists()
+    assert fresh_orphan.exists()
+
+
+def test_raw_serves_blob_content(client):
+    content = "y" * 64
+    url = client.post("/api/share", json={"content": content}).json()["url"]
+    public_id = url.rsplit("/", 1)[1]
+
+    response = client.get(f"/raw/{public_id}")
+
+    assert response.status_code == 200
+    assert response.text == content
+
+
+def test_missing_blob_returns_404_and_keeps_listing_up(client, blob_dir):
+    broken = client.post("/api/share", json={"content": "z" * 64}).json()["url"].rsplit("/", 1)[1]
+    fine = client.post("/api/share", json={"content": "fine"}).json()["url"].rsplit("/", 1)[1]
+    shutil.rmtree(blob_dir)
+
+    assert client.get(f"/raw/{broken}").status_code == 404
+    assert client.get(f"/output/{broken}").status_code == 404
+    assert client.get(f"/api/output/{broken}").status_code == 404
+
+    response = client.get("/outputs")
+    assert response.status_code == 200
+    assert fine in response.text
+    assert broken not in response.text
+
+    response = client.get("/api/outputs")
+    assert response.status_code == 200
+    assert broken not in [output["public_id"] for output in response.json()]
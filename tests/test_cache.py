@@ -0,0 +1,172 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from fetchbin.api.cache import MISSING, LRUCache, PageCache
+
+
+def test_page_cache_serves_fresh_body_without_rendering():
+    cache = PageCache(ttl=60)
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "page"
+
+    assert cache.get_or_render("newest", render) == "page"
+    assert cache.get_or_render("newest", render) == "page"
+    assert len(calls) == 1
+
+
+def test_page_cache_invalidate_triggers_rebuild():
+    cache = PageCache(ttl=60)
+    cache.get_or_render("newest", lambda: "old")
+    cache.invalidate()
+
+    assert cache.get_or_render("newest", lambda: "new") == "new"
+
+
+def test_page_cache_single_flight_serves_stale_during_rebuild():
+    cache = PageCache(ttl=60)
+    cache.get_or_render("newest", lambda: "old")
+    cache.invalidate()
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_render():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "new"
+
+    results = []
+    rebuilder = threading.Thread(target=lambda: results.append(cache.get_or_render("newest", slow_render)))
+    rebuilder.start()
+    started.wait(5)
+
+    # Every other caller gets the stale body instead of rendering again.
+    assert [cache.get_or_render("newest", slow_render) for _ in range(5)] == ["old"] * 5
+
+    release.set()
+    rebuilder.join(5)
+
+    assert results == ["new"]
+    assert len(calls) == 1
+
+
+def test_page_cache_serves_stale_body_when_rebuild_fails():
+    cache = PageCache(ttl=60)
+    cache.get_or_render("newest", lambda: "old")
+    cache.invalidate()
+
+    def failing_render():
+        raise RuntimeError("database is locked")
+
+    assert cache.get_or_render("newest", failing_render) == "old"
+    assert cache.get_or_render("newest", lambda: "new") == "new"
+
+
+def test_page_cache_propagates_error_without_body():
+    cache = PageCache(ttl=60)
+
+    def failing_render():
+        raise RuntimeError("database is locked")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_render("newest", failing_render)
+
+
+def make_share_cache(maxsize=4, negative_maxsize=4, maxbytes=0):
+    return LRUCache(
+        maxsize,
+        ttl=60,
+        negative_maxsize=negative_maxsize,
+        negative_ttl=60,
+        maxbytes=maxbytes,
+        weigh=lambda share: len(share.content),
+    )
+
+
+def test_lru_cache_negative_scan_does_not_evict_positive_entries():
+    cache = make_share_cache()
+    share = SimpleNamespace(content="hello")
+    cache.set("real", share)
+
+    for i in range(10):
+        assert cache.get(f"nope{i}") is MISSING
+        cache.set(f"nope{i}", None)
+
+    assert cache.get("real") is share
+    assert cache.get("nope9") is None
+    assert cache.get("nope0") is MISSING
+
+
+def test_lru_cache_evicts_least_recently_used_over_byte_budget():
+    cache = make_share_cache(maxbytes=10)
+    cache.set("a", SimpleNamespace(content="x" * 4))
+    cache.set("b", SimpleNamespace(content="x" * 4))
+    cache.get("a")
+    cache.set("c", SimpleNamespace(content="x" * 4))
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") is not MISSING
+    assert cache.get("c") is not MISSING
+    assert cache.stats()["bytes"] == 8
+
+
+def test_lru_cache_skips_values_larger_than_byte_budget():
+    cache = make_share_cache(maxbytes=10)
+    cache.set("small", SimpleNamespace(content="x"))
+    cache.set("huge", SimpleNamespace(content="x" * 11))
+
+    assert cache.get("huge") is MISSING
+    assert cache.get("small") is not MISSING
+    assert cache.stats()["bytes"] == 1
+
+
+def test_lru_cache_negative_entry_blocks_late_set_after_delete():
+    cache = make_share_cache()
+    share = SimpleNamespace(content="hello")
+    cache.set("deleted", share)
+
+    # A lookup read the row before the delete committed and caches it afterwards.
+    cache.set("deleted", None)
+    cache.set("deleted", share)
+
+    assert cache.get("deleted") is None
+
+
+def test_lru_cache_discard_clears_negative_entry():
+    cache = make_share_cache()
+    cache.set("new", None)
+    cache.discard("new")
+    share = SimpleNamespace(content="hello")
+    cache.set("new", share)
+
+    assert cache.get("new") is share
+
+
+def test_page_cache_invalidate_single_key():
+    cache = PageCache(ttl=60)
+    cache.get_or_render("hot", lambda: "old hot")
+    cache.get_or_render("newest", lambda: "old newest")
+    cache.invalidate("hot")
+
+    assert cache.get_or_render("hot", lambda: "new hot") == "new hot"
+    assert cache.get_or_render("newest", lambda: "new newest") == "old newest"
+
+
+def test_page_cache_invalidate_during_render_leaves_entry_stale():
+    cache = PageCache(ttl=60)
+    cache.get_or_render("hot", lambda: "old")
+    cache.invalidate("hot")
+
+    def render_racing_invalidate():
+        cache.invalidate("hot")
+        return "racy"
+
+    assert cache.get_or_render("hot", render_racing_invalidate) == "racy"
+    assert cache.get_or_render("hot", lambda: "new") == "new"
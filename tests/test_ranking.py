@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlmodel import Session, select
+
+from fetchbin.api import database, models, ranking
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session():
+    database.create_db_and_tables()
+
+    with Session(database.engine) as session:
+        yield session
+
+
+def add_share(session, **fields):
+    share = database.FetchOutput(content="share", **fields)
+    session.add(share)
+    session.commit()
+    session.refresh(share)
+    return share
+
+
+def test_hot_score_decays_with_age():
+    fresh = database.hot_score(5, 0, NOW, NOW)
+    older = database.hot_score(5, 0, NOW - timedelta(hours=10), NOW)
+
+    assert fresh > older > 0
+
+
+def test_hot_score_is_zero_outside_window():
+    created_at = NOW - timedelta(hours=models.Settings.HOT_WINDOW_HOURS)
+
+    assert database.hot_score(100, 0, created_at, NOW) == 0.0
+
+
+def test_hot_score_clamps_downvoted_shares_at_zero():
+    assert database.hot_score(0, 5, NOW, NOW) == 0.0
+
+
+def test_hot_score_accepts_naive_created_at():
+    assert database.hot_score(1, 0, NOW.replace(tzinfo=None), NOW) == database.hot_score(1, 0, NOW, NOW)
+
+
+def test_new_share_starts_at_age_zero_score():
+    assert database.NEW_SHARE_HOT_SCORE == database.hot_score(0, 0, NOW, NOW)
+    assert database.FetchOutput(content="x").hot_score == database.NEW_SHARE_HOT_SCORE
+
+
+def test_refresh_resets_aged_out_shares_and_skips_zero_scores(session):
+    aged_out = add_share(session, created_at=NOW - timedelta(days=30), hot_score=1.0)
+    cold = add_share(session, created_at=NOW - timedelta(days=60), hot_score=0.0, upvotes=3)
+    recent = add_share(session, upvotes=2)
+
+    ranking.refresh_hot_scores()
+
+    session.expire_all()
+    assert session.get(database.FetchOutput, aged_out.id).hot_score == 0.0
+    assert session.get(database.FetchOutput, cold.id).hot_score == 0.0
+    assert session.get(database.FetchOutput, recent.id).hot_score > database.NEW_SHARE_HOT_SCORE
+
+
+def test_refresh_keeps_score_written_by_concurrent_vote(session, monkeypatch):
+    share = add_share(session, hot_score=5.0)
+    hot_score = database.hot_score
+    voted = []
+
+    def hot_score_with_vote(*args):
+        if not voted:
+            voted.append(True)
+            with database.engine.begin() as connection:
+                connection.exec_driver_sql(
+                    "UPDATE fetch_output SET upvotes = upvotes + 1, hot_score = 42 WHERE id = ?", (share.id,)
+                )
+        return hot_score(*args)
+
+    monkeypatch.setattr(database, "hot_score", hot_score_with_vote)
+    ranking.refresh_hot_scores()
+
+    session.expire_all()
+    assert session.get(database.FetchOutput, share.id).hot_score == 42.0
+
+
+def test_refresh_query_uses_hot_score_index(session):
+    statement = select(database.FetchOutput.id).where(
+        (database.FetchOutput.hot_score > 0)
+        | (database.FetchOutput.hot_score < 0)
+        | (database.FetchOutput.hot_score == None)
+    )
+    sql = str(statement.compile(database.engine, compile_kwargs={"literal_binds": True}))
+
+    with database.engine.connect() as connection:
+        plan = [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+
+    assert "SCAN fetch_output" not in plan
+    assert any("ix_fetch_output_hot_score" in step for step in plan)